@@ -1389,7 +1389,7 @@ with the Abinit version you are using. Please contact the AbiPy developers.""" %
 
         return ddk_inputs
 
-    def make_dde_inputs(self, tolerance=None, use_symmetries=True, manager=None):
+    def make_dde_inputs(self, tolerance=None, use_symmetries=True, manager=None, perts=None):
         """
         Return |MultiDataset| inputs for the calculation of the electric field perturbations.
         This functions should be called with an input the represents a gs run.
@@ -1400,6 +1400,8 @@ with the Abinit version you are using. Please contact the AbiPy developers.""" %
             use_symmetries: boolean that computes the irreducible components of the perturbation.
                 Default to True. Should be set to False for nonlinear coefficients calculation.
             manager: |TaskManager| of the task. If None, the manager is initialized from the config file.
+            perts: List of irreducible perturbations as returned by `abiget_irred_ddeperts`.
+                If None, Abinit is called to compute them. Used only if `use_symmetries`.
         """
         if tolerance is None:
             tolerance = {"tolvrs": 1.0e-22}
@@ -1408,8 +1410,9 @@ with the Abinit version you are using. Please contact the AbiPy developers.""" %
             raise self.Error("Invalid tolerance: %s" % str(tolerance))
 
         if use_symmetries:
-            # Call Abinit to get the list of irred perts.
-            perts = self.abiget_irred_ddeperts(manager=manager)
+            # Call Abinit to get the list of irred perts (if not passed by the caller).
+            if perts is None:
+                perts = self.abiget_irred_ddeperts(manager=manager)
 
             # Build list of datasets (one input per irreducible perturbation)
             multi = MultiDataset.replicate_input(input=self, ndtset=len(perts))
@@ -1558,7 +1561,7 @@ with the Abinit version you are using. Please contact the AbiPy developers.""" %
 
         return multi
 
-    def make_strain_perts_inputs(self, tolerance=None, phonon_pert=True, kptopt=2, manager=None):
+    def make_strain_perts_inputs(self, tolerance=None, phonon_pert=True, kptopt=2, manager=None, perts=None):
         """
         Return |MultiDataset| inputs for strain perturbation calculation.
         This functions should be called with an input that represents a GS run.
@@ -1569,6 +1572,8 @@ with the Abinit version you are using. Please contact the AbiPy developers.""" %
             manager: |TaskManager| of the task. If None, the manager is initialized from the config file.
             phonon_pert: is True also the phonon perturbations will be considered. Default False.
             kptopt: 2 to take into account time-reversal symmetry.
+            perts: List of irreducible perturbations as returned by `abiget_irred_strainperts`
+                with the same value of `kptopt` and `phonon_pert`. If None, Abinit is called to compute them.
         """
         if tolerance is None:
             tolerance = {"tolvrs": 1.0e-12}
@@ -1576,7 +1581,8 @@ with the Abinit version you are using. Please contact the AbiPy developers.""" %
         if len(tolerance) != 1 or any(k not in _TOLVARS for k in tolerance):
             raise self.Error("Invalid tolerance: {}".format(str(tolerance)))
 
-        perts = self.abiget_irred_strainperts(kptopt=kptopt, manager=manager, phonon_pert=phonon_pert)
+        if perts is None:
+            perts = self.abiget_irred_strainperts(kptopt=kptopt, manager=manager, phonon_pert=phonon_pert)
         #print("Stress perts:", perts)
 
         # Build list of datasets (one input per perturbation)
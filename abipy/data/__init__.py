@@ -65,11 +65,21 @@ def cif_files(*filenames):
     return list(map(cif_file, filenames))
 
 
+# Structures already parsed by structure_from_cif (path --> Structure).
+_CIF_STRUCTURES = {}
+
+
 def structure_from_cif(filename):
     """
     Returnn an Abipy structure from the basename of the cif file in data/cifs.
+    The CIF file is parsed only once. A copy of the cached structure is returned
+    so that the caller can change it.
     """
-    return Structure.from_file(cif_file(filename))
+    path = cif_file(filename)
+    if path not in _CIF_STRUCTURES:
+        _CIF_STRUCTURES[path] = Structure.from_file(path)
+
+    return _CIF_STRUCTURES[path].copy()
 
 
 pseudo_dir = _PSEUDOS_DIRPATH
@@ -22,6 +22,8 @@ class DataModuleTest(AbipyTest):
 
         structure = abidata.structure_from_cif("gan2.cif")
         assert hasattr(structure, "to_abivars")
+        same_structure = abidata.structure_from_cif("gan2.cif")
+        assert same_structure == structure and same_structure is not structure
 
         structure = abidata.structure_from_mpid("mp-4820")
         assert hasattr(structure, "to_abivars")
@@ -1,7 +1,142 @@
 # coding: utf-8
 """Work subclasses related to DFTP."""
 
+import copy
+import collections
+import numpy as np
+
 from .works import Work, MergeDdb
+from .flows import Flow
+
+
+# Cache for the lists of irreducible perturbations computed by Abinit with the `abiget_irred_*perts`
+# methods of the GS input. Only the output of Abinit is cached: the DFPT inputs are always rebuilt
+# from the GS input passed by the caller so that structure, variables, tags and decorators are preserved.
+_IRRED_PERTS_CACHE = collections.OrderedDict()
+_IRRED_PERTS_CACHE_MAXSIZE = 128
+
+
+def _freeze(obj):
+    """
+    Convert obj into an hashable object that compares equal only if the values are exactly the same.
+    Numpy arrays are converted to (dtype, shape, bytes) so that no rounding is involved.
+    """
+    if isinstance(obj, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in obj.items()))
+    if isinstance(obj, (list, tuple, set)):
+        return tuple(_freeze(v) for v in obj)
+    if isinstance(obj, np.ndarray):
+        if obj.dtype == object: return _freeze(obj.tolist())
+        return (obj.dtype.str, obj.shape, obj.tobytes())
+    return obj
+
+
+def _irred_perts_key(scf_input):
+    """
+    Exact key for the irreducible perturbations computed with `scf_input`
+    given by the structure, the variables and the pseudos of the input.
+    """
+    structure = scf_input.structure
+    return (_freeze(structure.lattice.matrix), _freeze(structure.frac_coords),
+            tuple(site.specie.symbol for site in structure),
+            _freeze(dict(scf_input.items())),
+            tuple(p.filepath for p in scf_input.pseudos))
+
+
+def _cached_irred_perts(scf_input, method_name, input_key=None, **kwargs):
+    """
+    Call `scf_input.method_name(**kwargs)` to compute the list of irreducible perturbations and cache the result.
+    `input_key` can be used to pass the value of `_irred_perts_key(scf_input)` if already computed by the caller.
+    Return a deep copy of the cached list.
+    """
+    manager = kwargs.pop("manager", None)
+    if input_key is None: input_key = _irred_perts_key(scf_input)
+    key = (method_name, input_key, _freeze(kwargs))
+
+    perts = _IRRED_PERTS_CACHE.get(key)
+    if perts is None:
+        perts = getattr(scf_input, method_name)(manager=manager, **kwargs)
+        _IRRED_PERTS_CACHE[key] = perts
+        if len(_IRRED_PERTS_CACHE) > _IRRED_PERTS_CACHE_MAXSIZE:
+            _IRRED_PERTS_CACHE.popitem(last=False)
+    else:
+        _IRRED_PERTS_CACHE.move_to_end(key)
+
+    return copy.deepcopy(perts)
+
+
+# Names of the groups of tasks built by `_register_elastic_tasks` in the order used to register them.
+_ELASTIC_WORK_NAMES = ("wfk", "ddk", "dde", "phonon", "elastic")
+
+
+def _register_elastic_tasks(works, scf_input, with_relaxed_ion, with_piezo, with_dde, tolerances, den_deps, manager):
+    """
+    Register the tasks for the elastic constants in `works`, a dictionary mapping the
+    names in `_ELASTIC_WORK_NAMES` to the |Work| that will contain the tasks of that group.
+    """
+    # Exact key of the GS input shared by the cached irreducible perturbations.
+    input_key = _irred_perts_key(scf_input)
+
+    # Register task for WFK0 calculation (either SCF or NCSCF if den_deps is given)
+    if den_deps is None:
+        wfk_task = works["wfk"].register_scf_task(scf_input)
+    else:
+        tolwfr = 1.0e-20
+        if "nscf" in tolerances:
+            tolwfr = tolerances["nscf"]["tolwfr"]
+        nscf_input = scf_input.new_with_vars(iscf=-2, tolwfr=tolwfr)
+        wfk_task = works["wfk"].register_nscf_task(nscf_input, deps=den_deps)
+
+    ddk_deps_items = []
+    if with_piezo or with_dde:
+        # Calculate the ddk wf's needed for piezoelectric tensor and Born effective charges.
+        #ddk_tolerance = {"tolwfr": 1.0e-20}
+        ddk_tolerance = tolerances.get("ddk", None)
+        ddk_multi = scf_input.make_ddk_inputs(tolerance=ddk_tolerance, manager=manager)
+        for inp in ddk_multi:
+            ddk_task = works["ddk"].register_ddk_task(inp, deps={wfk_task: "WFK"})
+            ddk_deps_items.append((ddk_task, "DDK"))
+
+    # The DDE tasks and (if piezo) the phonon and strain tasks share the same deps: WFK + DDKs.
+    wfk_plus_ddk_deps = dict([(wfk_task, "WFK"), *ddk_deps_items])
+    ph_strain_deps = wfk_plus_ddk_deps if with_piezo else {wfk_task: "WFK"}
+
+    if with_dde:
+        # Add tasks for electric field perturbation.
+        #dde_tolerance = None
+        dde_tolerance = tolerances.get("dde", None)
+        dde_perts = _cached_irred_perts(scf_input, "abiget_irred_ddeperts", input_key=input_key,
+                                        manager=manager)
+        dde_multi = scf_input.make_dde_inputs(tolerance=dde_tolerance, use_symmetries=True, manager=manager,
+                                              perts=dde_perts)
+        for inp in dde_multi:
+            works["dde"].register_dde_task(inp, deps=wfk_plus_ddk_deps)
+
+    # Build input files for strain and (optionally) phonons.
+    #strain_tolerance = {"tolvrs": 1e-10}
+    strain_tolerance = tolerances.get("strain", None)
+    strain_perts = _cached_irred_perts(scf_input, "abiget_irred_strainperts", input_key=input_key, kptopt=2,
+                                       phonon_pert=with_relaxed_ion, manager=manager)
+    strain_multi = scf_input.make_strain_perts_inputs(tolerance=strain_tolerance, manager=manager,
+                                                      phonon_pert=with_relaxed_ion, kptopt=2, perts=strain_perts)
+
+    # Partition the inputs into phonon and strain perturbations in a single pass.
+    # Each input activates either rfphon or rfstrs (see make_strain_perts_inputs).
+    phonon_inputs, elastic_inputs = [], []
+    for inp in strain_multi:
+        if inp.get("rfphon", 0) == 1:
+            phonon_inputs.append(inp)
+        elif inp.get("rfstrs", 0) != 0:
+            elastic_inputs.append(inp)
+
+    if with_relaxed_ion:
+        # Phonon perturbation (read DDK if piezo).
+        for inp in phonon_inputs:
+            works["phonon"].register_phonon_task(inp, deps=ph_strain_deps)
+
+    # Finally compute strain pertubations (read DDK if piezo).
+    for inp in elastic_inputs:
+        works["elastic"].register_elastic_task(inp, deps=ph_strain_deps)
 
 
 class ElasticWork(Work, MergeDdb):
@@ -45,57 +180,8 @@ class ElasticWork(Work, MergeDdb):
         if tolerances is None: tolerances = {}
         new = cls(manager=manager)
 
-        # Register task for WFK0 calculation (either SCF or NCSCF if den_deps is given)
-        if den_deps is None:
-            wfk_task = new.register_scf_task(scf_input)
-        else:
-            tolwfr = 1.0e-20
-            if "nscf" in tolerances:
-                tolwfr = tolerances["nscf"]["tolwfr"]
-            nscf_input = scf_input.new_with_vars(iscf=-2, tolwfr=tolwfr)
-            wfk_task = new.register_nscf_task(nscf_input, deps=den_deps)
-
-        if with_piezo or with_dde:
-            # Calculate the ddk wf's needed for piezoelectric tensor and Born effective charges.
-            #ddk_tolerance = {"tolwfr": 1.0e-20}
-            ddk_tolerance = tolerances.get("ddk", None)
-            ddk_multi = scf_input.make_ddk_inputs(tolerance=ddk_tolerance, manager=manager)
-            ddk_tasks = []
-            for inp in ddk_multi:
-                ddk_task = new.register_ddk_task(inp, deps={wfk_task: "WFK"})
-                ddk_tasks.append(ddk_task)
-            ddk_deps = {ddk_task: "DDK" for ddk_task in ddk_tasks}
-
-        if with_dde:
-            # Add tasks for electric field perturbation.
-            #dde_tolerance = None
-            dde_tolerance = tolerances.get("dde", None)
-            dde_multi = scf_input.make_dde_inputs(tolerance=dde_tolerance, use_symmetries=True, manager=manager)
-            dde_deps = {wfk_task: "WFK"}
-            dde_deps.update(ddk_deps)
-            for inp in dde_multi:
-                new.register_dde_task(inp, deps=dde_deps)
-
-        # Build input files for strain and (optionally) phonons.
-        #strain_tolerance = {"tolvrs": 1e-10}
-        strain_tolerance = tolerances.get("strain", None)
-        strain_multi = scf_input.make_strain_perts_inputs(tolerance=strain_tolerance, manager=manager,
-            phonon_pert=with_relaxed_ion, kptopt=2)
-
-        if with_relaxed_ion:
-            # Phonon perturbation (read DDK if piezo).
-            ph_deps = {wfk_task: "WFK"}
-            if with_piezo: ph_deps.update(ddk_deps)
-            for inp in strain_multi:
-                if inp.get("rfphon", 0) == 1:
-                    new.register_phonon_task(inp, deps=ph_deps)
-
-        # Finally compute strain pertubations (read DDK if piezo).
-        elast_deps = {wfk_task: "WFK"}
-        if with_piezo: elast_deps.update(ddk_deps)
-        for inp in strain_multi:
-            if inp.get("rfstrs", 0) != 0:
-                new.register_elastic_task(inp, deps=elast_deps)
+        _register_elastic_tasks(dict.fromkeys(_ELASTIC_WORK_NAMES, new), scf_input, with_relaxed_ion,
+                                with_piezo, with_dde, tolerances, den_deps, manager)
 
         return new
 
@@ -112,6 +198,53 @@ class ElasticWork(Work, MergeDdb):
         return results
 
 
+class ElasticFlow(Flow):
+    """
+    This Flow computes the same quantities as |ElasticWork| but uses one Work for each group of tasks:
+    WFK, DDK (optional), DDE (optional), phonons at Gamma (optional) and strain perturbations.
+    The phonon and the strain works depend only on the WFK (and DDK) tasks
+    so that they are handled as independent nodes of the flow.
+    The DDB files produced by the tasks are merged in the outdir of the flow when the flow is completed.
+    """
+
+    @classmethod
+    def from_scf_input(cls, workdir, scf_input, with_relaxed_ion=True, with_piezo=False, with_dde=False,
+                       tolerances=None, den_deps=None, manager=None, allocate=True):
+        """
+        Build the flow from an input file representing a GS calculation.
+
+        Args:
+            workdir: Working directory of the flow.
+            scf_input: |AbinitInput| object with the parameters for the GS-SCF run.
+            See `ElasticWork.from_scf_input` for the meaning of the other arguments.
+            allocate: True if the flow should be allocated before returning.
+
+        Return: :class:`ElasticFlow` object.
+        """
+        if tolerances is None: tolerances = {}
+        works = {name: Work(manager=manager) for name in _ELASTIC_WORK_NAMES}
+
+        _register_elastic_tasks(works, scf_input, with_relaxed_ion,
+                                with_piezo, with_dde, tolerances, den_deps, manager)
+
+        flow = cls(workdir, manager=manager)
+        for name in _ELASTIC_WORK_NAMES:
+            if len(works[name]): flow.register_work(works[name])
+
+        if allocate: flow.allocate()
+
+        return flow
+
+    def finalize(self):
+        """This method is called when the flow is completed."""
+        # Merge all the DDB files produced by the tasks.
+        ddb_files = list(filter(None, [task.outdir.has_abiext("DDB") for task in self.iflat_tasks()]))
+        self._merge_ddb_files_in_outdir(ddb_files)
+
+        # Call the method of the super class.
+        return super().finalize()
+
+
 class NscfDdksWork(Work):
     """
     This work requires a DEN file and computes the KS energies with a non self-consistent task
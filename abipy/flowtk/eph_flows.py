@@ -5,6 +5,7 @@ Flows for electron-phonon calculations (high-level interface)
 import numpy as np
 
 from abipy.core.kpoints import kpath_from_bounds_and_ndivsm
+from .nodes import Dependency
 from .works import Work, PhononWork, PhononWfkqWork
 from .flows import Flow
 
@@ -109,7 +110,7 @@ class GkqPathFlow(Flow):
     @classmethod
     def from_scf_input(cls, workdir, scf_input, ngqpt, qbounds,
                        ndivsm=5, with_becs=True, ddk_tolerance=None,
-                       test_ft_interpolation=False, prepgkk=0, manager=None):
+                       test_ft_interpolation=False, prepgkk=0, manager=None, max_concurrent_works=1):
         """
         Build the flow from an input file representing a GS calculation.
 
@@ -125,12 +126,18 @@ class GkqPathFlow(Flow):
                 Use 0 to pass list of q-points.
             with_becs: Activate calculation of Electric field and Born effective charges.
             ddk_tolerance: dict {"varname": value} with the tolerance used in the DDK run if `with_becs`.
-            test_ft_interpolation: True to add an extra Work in which the GKQ files are computed
-                using the interpolated DFPT potentials and the q-mesh defined by `ngqpt`.
+            test_ft_interpolation: True to add extra Works (one per group of q-points, see `max_concurrent_works`)
+                in which the GKQ files are computed using the interpolated DFPT potentials and the q-mesh
+                defined by `ngqpt`.
                 The quality of the interpolation depends on the convergence of the BECS, epsinf and `ngqpt`.
             prepgkk: 1 to activate computation of all 3 * natom perts (debugging option).
             manager: |TaskManager| object.
+            max_concurrent_works: Maximum number of Works used to distribute the EPH tasks along the q-path.
+                Each Work contains a contiguous group of q-points.
         """
+        if max_concurrent_works < 1:
+            raise ValueError("max_concurrent_works should be >= 1. Received: %s" % max_concurrent_works)
+
         flow = cls(workdir=workdir, manager=manager)
 
         # First work with GS run.
@@ -159,47 +166,60 @@ class GkqPathFlow(Flow):
 
         flow.register_work(work_qpath)
 
-        def make_eph_input(scf_inp, ngqpt, qpt):
-            """
-            Build input file to compute GKQ.nc file from GS SCF input.
-            The calculation requires GS wavefunctions WFK, WFQ, a DDB file and a DVDB file
-            """
-            return scf_inp.new_with_vars(
-                optdriver=7,
-                eph_task=-2,
-                nqpt=1,
-                qpt=qpt,
-                ddb_ngqpt=ngqpt,  # q-mesh associated to the DDB file.
-                prtphdos=0,
-            )
-
-        # Now we compute matrix elements fully ab-initio for each q-point.
-        eph_work = Work()
-
-        qseen = set()
+        # Template for the EPH inputs used to compute the GKQ.nc files from the GS SCF input.
+        # The calculation requires GS wavefunctions WFK, WFQ, a DDB file and a DVDB file
+        eph_template = scf_input.new_with_vars(
+            optdriver=7,
+            eph_task=-2,
+            nqpt=1,
+            ddb_ngqpt=ngqpt,  # q-mesh associated to the DDB file.
+            prtphdos=0,
+        )
+
+        def make_eph_input(qpt, template=eph_template):
+            """Build input file to compute GKQ.nc file for this q-point from the template."""
+            t = template.deepcopy()
+            t.set_vars(qpt=qpt)
+            return t
+
+        # Keep the first phonon task for each q-point (the work has one task per irred perturbation)
+        # and build the EPH input for each unique q-point only once.
+        # setdefault preserves the order of the q-path and needs a single lookup per task.
+        unique_q_to_task = {}
         for task in work_qpath.phonon_tasks:
-            qpt = tuple(task.input["qpt"])
-            if qpt in qseen: continue
-            qseen.add(qpt)
-            t = eph_work.register_eph_task(make_eph_input(scf_input, ngqpt, qpt), deps=task.deps)
-            t.add_deps({work_qmesh: "DDB", work_qpath: "DVDB"})
+            unique_q_to_task.setdefault(tuple(task.input["qpt"]), task)
 
-        flow.register_work(eph_work)
+        base_inputs = [(q, task, make_eph_input(q)) for q, task in unique_q_to_task.items()]
 
-        # Here we build another work to compute gkq matrix elements with interpolated potentials along the q-path.
+        # Split the q-points into contiguous groups. Each group is computed in a different Work
+        # so that the EPH tasks for the different q-points are exposed as independent nodes of the flow.
+        nq = len(base_inputs)
+        ngroups = max(1, min(nq, max_concurrent_works))
+        bounds = [nq * ig // ngroups for ig in range(ngroups + 1)]
+        groups = [base_inputs[start:stop] for start, stop in zip(bounds[:-1], bounds[1:])]
+
+        # Now we compute matrix elements fully ab-initio for each q-point.
+        # Each EPH task inherits the deps of the phonon task (WFK, WFQ) and needs the DDB and the DVDB files.
+        # The deps are passed in a single shot to avoid a second add_deps pass over the tasks of the work.
+        extra_eph_deps = [Dependency(work_qmesh, "DDB"), Dependency(work_qpath, "DVDB")]
+        for group in groups:
+            eph_work = Work()
+            for q, task, eph_inp in group:
+                eph_work.register_eph_task(eph_inp, deps=task.deps + extra_eph_deps)
+            flow.register_work(eph_work)
+
+        # Here we build other works to compute gkq matrix elements with interpolated potentials along the q-path.
         # The potentials are interpolated using the input ngqpt q-mesh.
         if test_ft_interpolation:
-            inteph_work = Work()
-            qseen = set()
-            for task in work_qpath.phonon_tasks:
-                qpt = tuple(task.input["qpt"])
-                if qpt in qseen: continue
-                qseen.add(qpt)
-                eph_inp = make_eph_input(scf_input, ngqpt, qpt)
-                # Note eph_use_ftinterp 1 to force the interpolation of the DFPT potentials with eph_task -2.
-                eph_inp["eph_use_ftinterp"] = 1
-                t = inteph_work.register_eph_task(eph_inp, deps=task.deps)
-                t.add_deps({work_qmesh: ["DDB", "DVDB"]})
-            flow.register_work(inteph_work)
+            # Note eph_use_ftinterp 1 to force the interpolation of the DFPT potentials with eph_task -2.
+            ft_template = eph_template.deepcopy()
+            ft_template["eph_use_ftinterp"] = 1
+            extra_eph_deps_ft = [Dependency(work_qmesh, ["DDB", "DVDB"])]
+            for group in groups:
+                inteph_work = Work()
+                for q, task, _ in group:
+                    inteph_work.register_eph_task(make_eph_input(q, template=ft_template),
+                                                  deps=task.deps + extra_eph_deps_ft)
+                flow.register_work(inteph_work)
 
         return flow
@@ -2232,6 +2232,22 @@ class Flow(Node, NodeContainer, MSONable):
             # Update the database.
             self.pickle_dump()
 
+    def _merge_ddb_files_in_outdir(self, ddb_files):
+        """
+        Run mrgddb in sequential on the local machine to merge the list of DDB files `ddb_files`.
+        The final DDB file is produced in the outdir of the flow.
+
+        Return: path to the output DDB file.
+        """
+        out_ddb = self.outdir.path_in("out_DDB")
+        desc = "DDB file merged by %s on %s" % (self.__class__.__name__, time.asctime())
+
+        mrgddb = wrappers.Mrgddb(manager=self.manager, verbose=0)
+        mrgddb.merge(self.outdir.path, ddb_files, out_ddb=out_ddb, description=desc)
+        print("Final DDB file available at %s" % out_ddb)
+
+        return out_ddb
+
     @check_spectator
     def finalize(self):
         """
@@ -1,7 +1,9 @@
 # coding: utf-8
 """Work subclasses related to GS calculations."""
 import json
+import numpy as np
 
+from pymatgen.core.lattice import Lattice
 from .works import Work
 from abipy.core.structure import Structure
 
@@ -51,18 +53,23 @@ class EosWork(Work):
         lattice_type = structure.spget_lattice_type()
         assert lattice_type is not None
 
-        dvol = structure.volume * deltap_vol / 100
-        v0 = structure.volume - dvol * npoints
+        vol0 = structure.volume
+        dvol = vol0 * deltap_vol / 100
+        v0 = vol0 - dvol * npoints
         new_work.input_volumes = [v0 + ipt * dvol for ipt in range(2 * npoints + 1)]
 
         if "ecutsm" not in scf_input:
             print("Input does not define ecutsm input variable.\n",
                   "A default value of %s will be added to all the EOS inputs" % ecutsm)
 
-        for vol in new_work.input_volumes:
+        # Rescale the lattice vectors to obtain the new volumes (lengths proportions and angles are preserved).
+        base_matrix = np.asarray(structure.lattice.matrix)
+        factors = np.cbrt(np.array(new_work.input_volumes) / vol0)
+        scaled_matrices = base_matrix * factors[:, None, None]
+
+        for new_matrix in scaled_matrices:
             # Build structure with new volume and generate new input.
-            new_lattice = structure.lattice.scale(vol)
-            new_structure = Structure(new_lattice, structure.species, structure.frac_coords)
+            new_structure = Structure(Lattice(new_matrix), structure.species, structure.frac_coords)
             new_input = scf_input.new_with_structure(new_structure)
 
             # Add ecutsm if not already present.
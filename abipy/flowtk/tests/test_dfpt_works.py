@@ -2,6 +2,8 @@
 import abipy.data as abidata
 import abipy.flowtk as flowtk
 
+from abipy.flowtk import dfpt_works
+from abipy.core.structure import Structure
 from abipy.core.testing import AbipyTest
 
 
@@ -16,6 +18,9 @@ class TestDfptWorks(AbipyTest):
 
     def test_elastic_work(self):
         """Testing ElasticWork."""
+        # The cache of irreducible perturbations is global: start from a clean state.
+        dfpt_works._IRRED_PERTS_CACHE.clear()
+
         scf_task = self.get_gsinput_si(as_task=True)
         scf_input = scf_task.input
         den_deps = {scf_task: "DEN"}
@@ -25,6 +30,9 @@ class TestDfptWorks(AbipyTest):
             den_deps=den_deps, manager=None)
         self.abivalidate_work(work)
 
+        # One entry for the DDE perturbations and one for the strain perturbations.
+        assert len(dfpt_works._IRRED_PERTS_CACHE) == 2
+
         assert work[0].input["iscf"] == -2
         assert work[0].input["tolwfr"] == tolerances["nscf"]["tolwfr"]
         assert isinstance(work[0], flowtk.NscfTask)
@@ -34,3 +42,59 @@ class TestDfptWorks(AbipyTest):
         assert all(isinstance(task, flowtk.ElasticTask) for task in work[-6:])
         for task in work[-6:]:
             assert task.input["tolvrs"] == tolerances["strain"]["tolvrs"]
+
+        # The second call reuses the cached irreducible perturbations but builds new inputs.
+        work2 = flowtk.ElasticWork.from_scf_input(scf_input,
+            with_relaxed_ion=True, with_piezo=True, with_dde=True, tolerances=tolerances,
+            den_deps=den_deps, manager=None)
+        assert len(dfpt_works._IRRED_PERTS_CACHE) == 2
+        assert len(work2) == len(work)
+        for task, task2 in zip(work, work2):
+            assert task2.input is not task.input
+            assert task2.input.to_string() == task.input.to_string()
+
+        # Inputs that differ only in the tags or by tiny changes in xred must not share the DFPT inputs.
+        # Tags are not passed to Abinit so tagged_input reuses the cached perturbations.
+        tagged_input = scf_input.deepcopy()
+        tagged_input.add_tags("elastic_test")
+        work3 = flowtk.ElasticWork.from_scf_input(tagged_input,
+            with_relaxed_ion=True, with_piezo=True, with_dde=True, tolerances=tolerances,
+            den_deps=den_deps, manager=None)
+        assert len(dfpt_works._IRRED_PERTS_CACHE) == 2
+        assert all("elastic_test" in task.input.tags for task in work3)
+        assert not any("elastic_test" in task.input.tags for task in work)
+
+        structure = scf_input.structure
+        shifted_structure = Structure(structure.lattice, structure.species, structure.frac_coords + 1e-12)
+        shifted_input = scf_input.new_with_structure(shifted_structure)
+        work4 = flowtk.ElasticWork.from_scf_input(shifted_input,
+            with_relaxed_ion=True, with_piezo=True, with_dde=True, tolerances=tolerances,
+            den_deps=den_deps, manager=None)
+        # The structure is different so Abinit is called again for both kinds of perturbations.
+        assert len(dfpt_works._IRRED_PERTS_CACHE) == 4
+        for task in work4:
+            self.assert_equal(task.input.structure.frac_coords, shifted_input.structure.frac_coords)
+
+    def test_elastic_flow(self):
+        """Testing ElasticFlow."""
+        scf_input = self.get_gsinput_si()
+        workdir = self.mkdtemp()
+        flow = flowtk.ElasticFlow.from_scf_input(workdir, scf_input,
+            with_relaxed_ion=True, with_piezo=True, with_dde=True, manager=None)
+
+        assert isinstance(flow, flowtk.ElasticFlow)
+
+        # WFK, DDK, DDE, phonon and strain works.
+        assert len(flow) == 5
+        assert isinstance(flow[0][0], flowtk.ScfTask)
+        assert all(isinstance(task, flowtk.ElasticTask) for task in flow[-1])
+        assert all(task.input["kptopt"] == 2 for work in flow[1:] for task in work)
+
+        flow.check_status()
+        isok, checks = flow.abivalidate_inputs()
+        assert isok
+
+        # Without DDK and phonons.
+        flow = flowtk.ElasticFlow.from_scf_input(self.mkdtemp(), scf_input,
+            with_relaxed_ion=False, with_piezo=False, with_dde=False, manager=None)
+        assert len(flow) == 2
@@ -39,7 +39,44 @@ class TestEphFlows(AbipyTest):
 
         workdir = self.mkdtemp()
         flow = GkqPathFlow.from_scf_input(workdir, gs_inp, ngqpt, qbounds, ndivsm=2, with_becs=True, ddk_tolerance=None,
-                                          test_ft_interpolation=True, prepgkk=0)
+                                          test_ft_interpolation=True, prepgkk=0, max_concurrent_works=2)
+
+        # GS + q-mesh + q-path works followed by two EPH works and two interpolation works.
+        assert len(flow) == 7
+
+        # The three q-points of the path are split into two contiguous groups in q-path order.
+        work_qpath = flow[2]
+        qpath = []
+        for task in work_qpath.phonon_tasks:
+            qpt = tuple(task.input["qpt"])
+            if qpt not in qpath: qpath.append(qpt)
+        assert len(qpath) == 3
+        for eph_works in (flow[3:5], flow[5:7]):
+            assert sorted(len(work) for work in eph_works) == [1, 2]
+            assert [tuple(task.input["qpt"]) for work in eph_works for task in work] == qpath
+
+        # EPH tasks inherit the WFK/WFQ deps of the phonon task with the same q-point
+        # and read the DDB from the q-mesh work and the DVDB from the q-path work.
+        q_to_phtask = {}
+        for task in work_qpath.phonon_tasks:
+            q_to_phtask.setdefault(tuple(task.input["qpt"]), task)
+        for work in flow[3:5]:
+            for task in work:
+                node2exts = {dep.node: dep.exts for dep in task.deps}
+                for dep in q_to_phtask[tuple(task.input["qpt"])].deps:
+                    assert node2exts[dep.node] == dep.exts
+                assert node2exts[flow[1]] == ["DDB"]
+                assert node2exts[flow[2]] == ["DVDB"]
+
+        # With the Fourier interpolation, both DDB and DVDB come from the q-mesh work.
+        for work in flow[5:7]:
+            for task in work:
+                assert task.input["eph_use_ftinterp"] == 1
+                node2exts = {dep.node: dep.exts for dep in task.deps}
+                for dep in q_to_phtask[tuple(task.input["qpt"])].deps:
+                    assert node2exts[dep.node] == dep.exts
+                assert node2exts[flow[1]] == ["DDB", "DVDB"]
+                assert flow[2] not in node2exts
 
         #assert len(work.relax_tasks) == 3
         #assert all(t.input["dilatmx"] == 1.05 for t in work)
@@ -16,6 +16,7 @@ class TestGsWorks(AbipyTest):
         assert all(isinstance(task, flowtk.RelaxTask) for task in work)
         assert all(task.input["ecutsm"] == 2.0 for task in work)
         assert all(task.input["ionmov"] == 2 for task in work)
+        self.assert_almost_equal([task.input.structure.volume for task in work], work.input_volumes, decimal=5)
 
         work = gs_works.EosWork.from_scf_input(scf_input, npoints=3, deltap_vol=0.25, ecutsm=0.5, move_atoms=False)
         assert len(work) == 7